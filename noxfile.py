@@ -137,7 +137,7 @@ def mypy(session: Session) -> None:
 def tests(session: Session) -> None:
     """Run the test suite."""
     session.install(".")
-    session.install("coverage[toml]", "pytest", "pygments")
+    session.install("coverage[toml]", "pytest", "pygments", "orjson")
     try:
         session.run("coverage", "run", "--parallel", "-m", "pytest", *session.posargs)
     finally:
@@ -167,8 +167,26 @@ def coverage(session: Session) -> None:
 def typeguard(session: Session) -> None:
     """Runtime type checking using Typeguard."""
     session.install(".")
-    session.install("pytest", "pytest-mock", "typeguard", "pygments", "Faker")
-    session.run("pytest", f"--typeguard-packages={package}", *session.posargs)
+    session.install(
+        "pytest",
+        "pytest-mock",
+        "pytest-xdist",
+        "typeguard",
+        "pygments",
+        "Faker",
+        "orjson",
+    )
+    # Test modules are independent and file-isolated ('tmpdir_factory'
+    # namespaces per worker), so run one provider module per core
+    session.run(
+        "pytest",
+        "-n",
+        "auto",
+        "--dist",
+        "loadfile",
+        f"--typeguard-packages={package}",
+        *session.posargs,
+    )
 
 
 @session(python=python_versions)
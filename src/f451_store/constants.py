@@ -20,6 +20,7 @@ STORAGE_JSON: str = "f451_json"
 STORAGE_SQLITE: str = "f451_sqlite"
 
 KWD_APPEND: str = "append"
+KWD_BATCH_SIZE: str = "batch_size"
 KWD_CLOSE: str = "close"
 KWD_CREATE: str = "create"
 KWD_DEBUG: str = "debug"  # Reserved
@@ -29,6 +30,7 @@ KWD_OLDEST: str = "oldest"
 KWD_NEWEST: str = "newest"
 KWD_LOG_LEVEL: str = "log_level"
 KWD_MODE: str = "mode"
+KWD_FAST: str = "fast"
 KWD_FORCE: str = "force"
 KWD_SUPPRESS_ERROR: str = "suppress_errors"
 KWD_SAVE: str = "save"
@@ -40,6 +42,16 @@ KWD_GET: str = "get"
 KWD_RETRIEVE: str = "retrieve"
 KWD_ORDER_BY: str = "order_by"
 KWD_IN_MEMORY: str = ":memory:"  # Reserved for use with SQLite
+KWD_JOURNAL_MODE: str = "journal_mode"  # Used for SQLite
+KWD_SYNCHRONOUS: str = "synchronous"  # Used for SQLite
+KWD_MMAP_SIZE: str = "mmap_size"  # Used for SQLite
+KWD_PAGE_SIZE: str = "page_size"  # Used for SQLite
+KWD_CACHE_SIZE: str = "cache_size"  # Used for SQLite
+KWD_USE_POOL: str = "use_pool"  # Used for SQLite
+KWD_LOCKING_MODE: str = "locking_mode"  # Used for SQLite
+KWD_ROW_FACTORY: str = "row_factory"  # Used for SQLite
+KWD_STREAM: str = "stream"  # Used for SQLite
+KWD_TEMP_STORE: str = "temp_store"  # Used for SQLite
 KWD_DB_HOST: str = "db_host"  # Used for all services
 KWD_DB_PORT: str = "db_port"  # Used for MySQL, Postgres
 KWD_DB_NAME: str = "db_name"  # Used for MySQL, Postgres
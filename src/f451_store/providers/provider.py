@@ -10,6 +10,7 @@ from abc import abstractmethod
 from pathlib import Path
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Union
@@ -235,12 +236,20 @@ class Provider(ABC):
         pass
 
     @abstractmethod
-    def retrieve_records(self, numRecs: int = 1, **kwargs: Any) -> List[Dict[str, Any]]:
-        """Stub for 'retrieve_data()' method."""
+    def retrieve_records(
+        self, numRecs: int = 1, **kwargs: Any
+    ) -> Union[List[Dict[str, Any]], Iterator[Any]]:
+        """Stub for 'retrieve_data()' method.
+
+        Providers that support streaming (e.g. SQLite) may return a
+        generator over the records instead of a materialized list.
+        """
         pass
 
     @abstractmethod
-    def trim_records(self, numRecs: int = 0, **kwargs: Any) -> int:
+    def trim_records(
+        self, numRecs: int = 0, **kwargs: Any
+    ) -> Union[int, List[Any]]:
         """Trim first or last 'numREcs' records."""
         pass
 
@@ -253,11 +262,15 @@ class Provider(ABC):
         """Wrapper for 'store_data()' method."""
         return self.store_records(inData)
 
-    def get_data(self, numRecs: int = 1, **kwargs: Any) -> List[Dict[str, Any]]:
+    def get_data(
+        self, numRecs: int = 1, **kwargs: Any
+    ) -> Union[List[Dict[str, Any]], Iterator[Any]]:
         """Wrapper for 'retrieve_data()' method."""
         return self.retrieve_records(numRecs, **kwargs)
 
-    def delete_data(self, numRecs: int = 0, **kwargs: Any) -> int:
+    def delete_data(
+        self, numRecs: int = 0, **kwargs: Any
+    ) -> Union[int, List[Any]]:
         """Wrapper for 'retrieve_data()' method."""
         return self.trim_records(numRecs, **kwargs)
 
@@ -10,9 +10,11 @@ from abc import abstractmethod
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Mapping
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import f451_store.constants as const
@@ -76,6 +78,26 @@ class BaseSQL(Provider):
         self._create: bool = kwargs.get(const.KWD_CREATE, False)
         self._append: bool = kwargs.get(const.KWD_APPEND, True)
 
+        # Pre-compute column schema once -- 'verify_db_fields()' guarantees
+        # that every data field has a valid format mapping, and any schema
+        # errors therefore surface here at construction time instead of
+        # inside the per-row loops of the DB helper methods.
+        self._columns: List[Tuple[str, str]] = []
+        self._indexedColumns: List[str] = []
+        for (key, val) in self._dataFields.items():
+            sqlType, isIdx = self._split_type_idx(str(self._dataFormats[val]))
+            self._columns.append((str(key), sqlType))
+            if isIdx:
+                self._indexedColumns.append(str(key))
+
+    @staticmethod
+    def _split_type_idx(inStr: str) -> Tuple[str, bool]:
+        parts = inStr.split("|")
+        if len(parts) > 1:
+            return parts[0], (parts[1].lower() == "idx")
+
+        return parts[0], False
+
     @property
     def isCreateMode(self) -> bool:
         """Return 'createMode' property."""
@@ -109,12 +131,20 @@ class BaseSQL(Provider):
         pass
 
     @abstractmethod
-    def retrieve_records(self, numRecs: int = 1, **kwargs: Any) -> List[Dict[str, Any]]:
-        """Stub for 'retrieve_data()' method."""
+    def retrieve_records(
+        self, numRecs: int = 1, **kwargs: Any
+    ) -> Union[List[Dict[str, Any]], Iterator[Any]]:
+        """Stub for 'retrieve_data()' method.
+
+        Providers that support streaming (e.g. SQLite) may return a
+        generator over the records instead of a materialized list.
+        """
         pass
 
     @abstractmethod
-    def trim_records(self, numRecs: int = 0, **kwargs: Any) -> int:
+    def trim_records(
+        self, numRecs: int = 0, **kwargs: Any
+    ) -> Union[int, List[Any]]:
         """Stub for 'trim_records()' method."""
         pass
 
@@ -3,15 +3,18 @@
 This module adds an abstraction layer for the SQLite storage provider. Its
 main purpose is to support SQLite storage.
 """
+import itertools
 import logging
+import operator
 import pprint
 import sqlite3
 from pathlib import Path
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
-from typing import Mapping
 from typing import Optional
 from typing import Tuple
 from typing import Union
@@ -22,6 +25,7 @@ from f451_store.exceptions import InvalidAttributeError
 from f451_store.exceptions import StorageAccessError
 from f451_store.exceptions import StorageConnectionError
 from f451_store.providers.provider import verify_file
+from f451_store.providers.sqlite_pool import SQLiteConnectionPool
 
 # =========================================================
 #          G L O B A L S   A N D   H E L P E R S
@@ -29,6 +33,38 @@ from f451_store.providers.provider import verify_file
 SRV_CONFIG_SCTN: str = "f451_sqlite"
 SRV_PROVIDER: str = "SQLite"
 
+DEFAULT_BATCH_SIZE: int = 10000  # Max rows per 'executemany()' batch
+DEFAULT_ARRAY_SIZE: int = 1024  # Rows per 'fetchmany()' batch when streaming
+
+# WAL journaling with 'NORMAL' sync avoids the two fsyncs per commit that
+# SQLite's default 'DELETE' journal + 'FULL' sync mode requires, and also
+# allows concurrent readers. Both can be overridden via constructor kwargs.
+DEFAULT_JOURNAL_MODE: str = "WAL"
+DEFAULT_SYNCHRONOUS: str = "NORMAL"
+
+# Memory-mapped I/O lets SQLite serve page reads straight from the OS page
+# cache instead of one 'pread()' syscall per page -- see sqlite.org/mmap.html.
+# This is an upper bound on mapped bytes, not an allocation.
+DEFAULT_MMAP_SIZE: int = 268435456  # 256 MiB
+
+# Larger pages mean a shallower B-tree and fewer random I/Os per lookup.
+# Page size can only be set before the first table is written (and before
+# WAL journaling kicks in), so it only applies to newly created databases.
+DEFAULT_PAGE_SIZE: int = 65536  # 64 KiB
+
+# A negative 'cache_size' is interpreted as KiB (-16000 == 16 MiB) and keeps
+# more hot pages in RAM; 'temp_store=MEMORY' keeps the temporary B-trees that
+# back 'ORDER BY' sorts in RAM as well. Both trade memory for speed and can
+# be dialed down via constructor kwargs on memory-constrained hosts.
+DEFAULT_CACHE_SIZE: int = -16000  # 16 MiB
+DEFAULT_TEMP_STORE: str = "MEMORY"
+
+# 'EXCLUSIVE' locking acquires the file lock once and holds it for the whole
+# session instead of acquiring/releasing per statement. That removes lock
+# traffic on bulk imports (pair with 'synchronous=OFF' for throwaway data),
+# but precludes any concurrent readers/writers for the duration.
+DEFAULT_LOCKING_MODE: str = "NORMAL"
+
 log = logging.getLogger()
 pp = pprint.PrettyPrinter(indent=4)
 
@@ -44,6 +80,30 @@ FORMAT_MAP = {
 typeDefConnector = Union[sqlite3.Connection, None]
 typeDefData = Union[List[Dict[str, Any]], Dict[str, Any]]
 
+# Shared (module-level) pool -- all 'SQLite' instances pointing at the same
+# database file reuse each other's released connections
+_connectionPool = SQLiteConnectionPool()
+
+
+def _make_row_extractor(
+    validFlds: Tuple[str, ...]
+) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """Create extractor pulling 'validFlds' values from a data row as tuple.
+
+    'operator.itemgetter' pulls the values in a single C call, but returns
+    a single value -- not a tuple -- for a single field, and we need to
+    wrap that case to keep 'executemany()' happy.
+    """
+    getter = operator.itemgetter(*validFlds)
+    if len(validFlds) == 1:
+
+        def _wrap_single(row: Dict[str, Any]) -> Tuple[Any, ...]:
+            return (getter(row),)
+
+        return _wrap_single
+
+    return getter
+
 
 # =========================================================
 #        M A I N   C L A S S   D E F I N I T I O N
@@ -76,12 +136,81 @@ class SQLite(sql.BaseSQL):
             **kwargs,
         )
         self._dbConn: typeDefConnector = None
+        self._dbCursor: Optional[sqlite3.Cursor] = None
+        self._journalMode: str = str(
+            kwargs.get(const.KWD_JOURNAL_MODE, DEFAULT_JOURNAL_MODE)
+        )
+        self._synchronous: str = str(
+            kwargs.get(const.KWD_SYNCHRONOUS, DEFAULT_SYNCHRONOUS)
+        )
+        self._mmapSize: int = int(kwargs.get(const.KWD_MMAP_SIZE, DEFAULT_MMAP_SIZE))
+        self._pageSize: int = int(kwargs.get(const.KWD_PAGE_SIZE, DEFAULT_PAGE_SIZE))
+        self._cacheSize: int = int(kwargs.get(const.KWD_CACHE_SIZE, DEFAULT_CACHE_SIZE))
+        self._tempStore: str = str(kwargs.get(const.KWD_TEMP_STORE, DEFAULT_TEMP_STORE))
+        self._lockingMode: str = str(
+            kwargs.get(const.KWD_LOCKING_MODE, DEFAULT_LOCKING_MODE)
+        ).upper()
+        # 'sqlite3.Row' gives O(1) named access backed by a C object with
+        # no per-row dict allocation -- pass 'row_factory=None' for tuples
+        self._rowFactory: Any = kwargs.get(const.KWD_ROW_FACTORY, sqlite3.Row)
+        # Pooling a ':memory:' connection would keep its data alive across
+        # logical open/close cycles, so only file-backed databases pool
+        self._usePool: bool = bool(kwargs.get(const.KWD_USE_POOL, True)) and (
+            str(self._dbHost).lower() != const.KWD_IN_MEMORY
+        )
+        self._compile_insert()
+        # Cache for 'INSERT' statements and row extractors generated for
+        # non-default table and/or field combinations, keyed by '(table, fields)'
+        self._insertSQLCache: Dict[
+            Tuple[str, Tuple[str, ...]],
+            Tuple[str, Callable[[Dict[str, Any]], Tuple[Any, ...]]],
+        ] = {}
 
     @property
     def isConnectionOpen(self) -> bool:
         """Return 'dbConn' property."""
         return self._dbConn is not None
 
+    @property
+    def journalMode(self) -> str:
+        """Return 'journalMode' property."""
+        return self._journalMode
+
+    @property
+    def synchronous(self) -> str:
+        """Return 'synchronous' property."""
+        return self._synchronous
+
+    @property
+    def mmapSize(self) -> int:
+        """Return 'mmapSize' property."""
+        return self._mmapSize
+
+    @property
+    def pageSize(self) -> int:
+        """Return 'pageSize' property."""
+        return self._pageSize
+
+    @property
+    def cacheSize(self) -> int:
+        """Return 'cacheSize' property."""
+        return self._cacheSize
+
+    @property
+    def tempStore(self) -> str:
+        """Return 'tempStore' property."""
+        return self._tempStore
+
+    @property
+    def usePool(self) -> bool:
+        """Return 'usePool' property."""
+        return self._usePool
+
+    @property
+    def lockingMode(self) -> str:
+        """Return 'lockingMode' property."""
+        return self._lockingMode
+
     def connect_open(self, force: Optional[bool] = False) -> typeDefConnector:
         """Establish connection to SQLite database.
 
@@ -96,12 +225,41 @@ class SQLite(sql.BaseSQL):
             StorageConnectionError: If unable to establish connection to SQLite database
         """
         if force and self._dbConn is not None:
-            self._dbConn.close()
-            self._dbConn = None
+            self._release_connection()
 
         if self._dbConn is None:
             try:
-                self._dbConn = sqlite3.connect(self._dbHost)
+                self._dbConn = (
+                    _connectionPool.acquire(str(self._dbHost))
+                    if self._usePool
+                    else sqlite3.connect(self._dbHost)
+                )
+                self._dbConn.row_factory = self._rowFactory
+
+                # Journal mode only applies to file-backed databases --
+                # in-memory databases have no journal (or fsyncs) at all
+                if str(self._dbHost).lower() != const.KWD_IN_MEMORY:
+                    # Page size only takes effect on an empty database, and
+                    # must be set before WAL journaling locks it in
+                    pageCount = self._dbConn.execute("PRAGMA page_count").fetchone()[0]
+                    if pageCount == 0:
+                        self._dbConn.execute(f"PRAGMA page_size={self._pageSize}")
+
+                    self._dbConn.execute(f"PRAGMA journal_mode={self._journalMode}")
+                    self._dbConn.execute(f"PRAGMA synchronous={self._synchronous}")
+                    self._dbConn.execute(f"PRAGMA mmap_size={self._mmapSize}")
+
+                    # Hold the file lock for the whole session on request --
+                    # e.g. for bulk imports where no other reader/writer
+                    # needs access to the database. Always set explicitly so
+                    # a pool-acquired connection cannot carry over another
+                    # instance's locking mode.
+                    self._dbConn.execute(f"PRAGMA locking_mode={self._lockingMode}")
+
+                # Keep hot pages and 'ORDER BY' sort state in RAM -- these
+                # also help in-memory databases (temp B-trees are separate)
+                self._dbConn.execute(f"PRAGMA cache_size={self._cacheSize}")
+                self._dbConn.execute(f"PRAGMA temp_store={self._tempStore}")
 
             except sqlite3.Error as e:
                 log.error(
@@ -122,13 +280,40 @@ class SQLite(sql.BaseSQL):
                 If 'True' then we close any open connection and create new connection
         """
         if force and self._dbConn is not None:
-            self._dbConn.close()
+            self._release_connection()
+
+    def _get_cursor(self) -> sqlite3.Cursor:
+        """Return shared cursor for current connection session.
+
+        Creating a cursor per operation allocates and tears down statement
+        state in the C layer every time; one cursor per open connection
+        amortizes that across sequential create/has/store/count calls.
+        """
+        if self._dbCursor is None:
+            self._dbCursor = self.connect_open().cursor()  # type: ignore[union-attr]
+
+        return self._dbCursor
+
+    def _release_connection(self) -> None:
+        """Return current connection to shared pool, or close it."""
+        self._dbCursor = None
+        if self._dbConn is not None:
+            if self._usePool and self._lockingMode == DEFAULT_LOCKING_MODE:
+                _connectionPool.release(str(self._dbHost), self._dbConn)
+            else:
+                # An 'EXCLUSIVE' locking-mode connection holds the file lock
+                # until it is truly closed -- parking it in the shared pool
+                # would block every other connection to this database
+                self._dbConn.close()
+
             self._dbConn = None
 
     def _has_table_helper(self, dbTable: Optional[str] = None) -> bool:
         """Helper method to check if given database table exists.
 
-        SQLIte3 stores table names in the 'sqlite_master' table.
+        'PRAGMA table_info()' returns an empty result set for non-existent
+        tables without scanning 'sqlite_master', which makes it the cheap,
+        idiomatic existence probe.
 
         Args:
             dbTable:
@@ -141,23 +326,21 @@ class SQLite(sql.BaseSQL):
             StorageAccessError: If database table cannot be verified.
         """
         tblName = self._dbTable if not dbTable else dbTable
-        dbConn = self.connect_open()
+        self.connect_open()
 
         if self._dbConn is None:
             log.error(f"Unable to connect to {SRV_PROVIDER} database: '{tblName}'")
             raise StorageAccessError(SRV_PROVIDER)
 
-        dbCur = dbConn.cursor()  # type: ignore[union-attr]
+        dbCur = self._get_cursor()
         try:
-            dbCur.execute(
-                f"SELECT count(name) FROM sqlite_master WHERE type='table' AND name='{tblName}';"  # noqa: S608
-            )
+            dbCur.execute(f"PRAGMA table_info({quote_identifier(tblName)});")
         except sqlite3.Error as e:
             log.error(f"Unable to verify table in {SRV_PROVIDER} database: '{tblName}'")
             self.connect_close(True)
             raise StorageAccessError(SRV_PROVIDER) from e
 
-        return int(dbCur.fetchone()[0]) == 1
+        return dbCur.fetchone() is not None
 
     def _create_table_helper(
         self,
@@ -180,28 +363,45 @@ class SQLite(sql.BaseSQL):
             StorageAccessError: If database table cannot be created.
         """
         tblName = self._dbTable if not dbTable else dbTable
-        dtaFlds = self._dataFields if not dataFields else dataFields
-        fmtMap = self._dataFormats if not formatMap else formatMap
-        dbConn = self.connect_open()
+        self.connect_open()
 
         if self._dbConn is None:
             log.error(f"Unable to connect to {SRV_PROVIDER} database: '{tblName}'")
             raise StorageAccessError(SRV_PROVIDER)
 
-        dbCur = dbConn.cursor()  # type: ignore[union-attr]
+        dbCur = self._get_cursor()
 
         try:
-            newFlds = [
-                f"{str(key)} {self._split_type_idx(str(fmtMap[val]))[0]}"
-                for (key, val) in dtaFlds.items()
-            ]
-            dbCur.execute(
-                f"CREATE TABLE IF NOT EXISTS {tblName} ({','.join(newFlds)});"
-            )
+            if dataFields is None and formatMap is None:
+                # Use column schema pre-computed at construction time
+                columns = self._columns
+                idxFlds = self._indexedColumns
+            else:
+                dtaFlds = self._dataFields if not dataFields else dataFields
+                fmtMap = self._dataFormats if not formatMap else formatMap
+                columns = [
+                    (str(key), self._split_type_idx(str(fmtMap[val]))[0])
+                    for (key, val) in dtaFlds.items()
+                ]
+                idxFlds = [
+                    str(key)
+                    for (key, val) in dtaFlds.items()
+                    if self._split_type_idx(str(fmtMap[val]))[1]
+                ]
+
+            newFlds = [f"{key} {sqlType}" for (key, sqlType) in columns]
 
             # SQLite automatically creates a 'primary key' column, and we'll therefore
-            # only create indexed columns as indicated in 'fldNamesWithTypes'.
-            self._create_indexed_columns(dbCur, dtaFlds, fmtMap, tblName)
+            # only create indexed columns as indicated in the column schema. Running
+            # 'CREATE TABLE' and all 'CREATE INDEX' statements as one script compiles
+            # them in a single pass and executes them inside one transaction, instead
+            # of paying statement compile + commit overhead per 'execute()' call.
+            ddlStmts = [f"CREATE TABLE IF NOT EXISTS {tblName} ({','.join(newFlds)});"]
+            ddlStmts.extend(
+                f"CREATE INDEX idx_{tblName}_{key} ON {tblName}({key});"
+                for key in idxFlds
+            )
+            dbCur.executescript("\n".join(ddlStmts))
 
         except KeyError as e:
             log.error(f"Invalid data format: '{str(e)}'")
@@ -213,44 +413,43 @@ class SQLite(sql.BaseSQL):
             self.connect_close(True)
             raise StorageAccessError(SRV_PROVIDER) from e
 
-    def _create_indexed_columns(
-        self,
-        dbCur: sqlite3.Cursor,
-        dtaFlds: Dict[str, str],
-        fmtMap: Union[Mapping[str, Callable[[Any], Any]], Dict[str, str]],
-        tblName: str,
-    ) -> None:
-        """Create indexed columns."""
-        try:
-            for (key, val) in dtaFlds.items():
-                if self._split_type_idx(str(fmtMap[val]))[1]:
-                    dbCur.execute(
-                        f"CREATE INDEX idx_{tblName}_{key} ON {tblName}({key});"
-                    )
+    def _compile_insert(self) -> None:
+        """Pre-compile 'INSERT' statement and row extractor.
 
-        except sqlite3.Error as e:
-            log.error(
-                f"Unable to create table index in {SRV_PROVIDER} database: '{tblName}'"
-            )
-            self.connect_close(True)
-            raise StorageAccessError(SRV_PROVIDER) from e
+        The set of data fields is known at initialization, and we can
+        therefore generate the exact 'INSERT' SQL string once instead of
+        rebuilding it on every call to '_store_records_helper()'. We also
+        compile an 'operator.itemgetter' for the field order, which pulls
+        values from a data row (as a tuple) in a single C call instead of
+        a per-row list comprehension.
+
+        Note: this method must be called again if 'dataFields' ever changes.
+        """
+        validFlds = tuple(self._dataFields.keys())
+        flds = ",".join(validFlds)
+        vals = ",".join("?" for _ in validFlds)
 
-    @staticmethod
-    def _split_type_idx(inStr: str) -> Tuple[str, bool]:
-        parts = inStr.split("|")
-        if len(parts) > 1:
-            return parts[0], (parts[1].lower() == "idx")
+        self._fieldOrder: Tuple[str, ...] = validFlds
+        self._insertSQL: str = f"INSERT INTO {self._dbTable}({flds}) VALUES({vals})"  # noqa: S608
 
-        return parts[0], False
+        self._rowExtract: Callable[
+            [Dict[str, Any]], Tuple[Any, ...]
+        ] = _make_row_extractor(validFlds)
 
     def _store_records_helper(
         self,
         data: List[Dict[str, Any]],
         dbTable: Optional[str] = None,
         dataFields: Optional[Dict[str, str]] = None,
+        batchSize: int = DEFAULT_BATCH_SIZE,
     ) -> None:
         """Helper method to store data records in an SQLite database.
 
+        All rows are inserted within the single transaction managed by the
+        caller (the 'sqlite3' module auto-BEGINs on the first 'INSERT', and
+        'store_records()' commits once at the end), so a bulk insert pays
+        one fsync instead of one per row.
+
         Args:
             data:
                 Data to be stored as single 'dict' or 'list' of 'dicts'
@@ -258,35 +457,63 @@ class SQLite(sql.BaseSQL):
                 Name of database table
             dataFields:
                 Data fields
+            batchSize:
+                Max number of rows per 'executemany()' batch
 
         Raises:
             StorageAccessError: If database table cannot be verified.
         """
         tblName = self._dbTable if not dbTable else dbTable
         dtaFlds = self._dataFields if not dataFields else dataFields
-        dbConn = self.connect_open()
+        self.connect_open()
 
         if self._dbConn is None:
             log.error(f"Unable to connect to {SRV_PROVIDER} database: '{tblName}'")
             raise StorageAccessError(SRV_PROVIDER)
 
-        dbCur = dbConn.cursor()  # type: ignore[union-attr]
+        dbCur = self._get_cursor()
 
         try:
-            # Filter each row to only hold approved keys using dictionary
-            # comprehension and, of course, a common set of keys ;-)
-            validFlds = list(set(data[0].keys()) & set(dtaFlds.keys()))
-            if len(validFlds) > 0:
-                flds = ",".join(validFlds)
-                vals = ",".join("?" for _ in validFlds)
-                for row in data:
-                    # Using list comprehension to only pull values
-                    # that we want/need from a row of data
-                    dbCur.execute(
-                        f"INSERT INTO {tblName}({flds}) VALUES({vals})",
-                        [row[key] for key in validFlds],
+            if (
+                dbTable is None
+                and dataFields is None
+                and data
+                and set(self._fieldOrder) <= data[0].keys()
+            ):
+                # Use pre-compiled 'INSERT' statement and row extractor
+                # when we're working against the default table and schema.
+                # 'executemany()' reuses a single prepared statement, and
+                # batching caps the size of any one parameter sequence.
+                insertSQL = self._insertSQL
+                rowExtract = self._rowExtract
+                for idx in range(0, len(data), batchSize):
+                    dbCur.executemany(
+                        insertSQL, map(rowExtract, data[idx : idx + batchSize])
                     )
 
+            else:
+                # Filter each row to only hold approved keys -- order is kept
+                # stable (field map order) so the same combination of table
+                # and fields always maps to the same cached statement
+                validFlds = tuple(key for key in dtaFlds.keys() if key in data[0])
+                if len(validFlds) > 0:
+                    cacheKey = (tblName, validFlds)
+                    cached = self._insertSQLCache.get(cacheKey)
+                    if cached is None:
+                        flds = ",".join(validFlds)
+                        vals = ",".join("?" for _ in validFlds)
+                        cached = (
+                            f"INSERT INTO {tblName}({flds}) VALUES({vals})",  # noqa: S608
+                            _make_row_extractor(validFlds),
+                        )
+                        self._insertSQLCache[cacheKey] = cached
+
+                    # Single prepared statement for all rows -- the cached
+                    # 'itemgetter' pulls only the wanted/needed values from
+                    # each data row in a single C call
+                    insertSQL, rowExtract = cached
+                    dbCur.executemany(insertSQL, map(rowExtract, data))
+
         except sqlite3.Error as e:
             log.error(
                 f"Unable to store records in {SRV_PROVIDER} database: '{self._dbTable}'"
@@ -294,12 +521,19 @@ class SQLite(sql.BaseSQL):
             self.connect_close(True)
             raise StorageAccessError(SRV_PROVIDER) from e
 
-    def _count_records_helper(self, dbTable: Optional[str] = None) -> int:
+    def _count_records_helper(
+        self, dbTable: Optional[str] = None, fast: bool = False
+    ) -> int:
         """Helper method to count number of records in an SQLite database.
 
         Args:
             dbTable:
                 Name of database table
+            fast:
+                If 'True' then count via 'max(rowid)' which returns in O(1)
+                instead of the O(N) table scan that 'COUNT(*)' requires.
+                Only accurate for pure-append tables -- deletes leave gaps
+                in the rowid sequence.
 
         Returns:
             Number of records in a table
@@ -308,21 +542,25 @@ class SQLite(sql.BaseSQL):
             StorageAccessError: If database table cannot be verified.
         """
         tblName = self._dbTable if not dbTable else dbTable
-        dbConn = self.connect_open()
+        self.connect_open()
 
         if self._dbConn is None:
             log.error(f"Unable to connect to {SRV_PROVIDER} database: '{tblName}'")
             raise StorageAccessError(SRV_PROVIDER)
 
-        dbCur = dbConn.cursor()  # type: ignore[union-attr]
+        dbCur = self._get_cursor()
 
         if not self._has_table_helper(tblName):
             return 0
 
         numRecs = 0
         try:
-            dbCur.execute(f"SELECT COUNT(*) FROM {tblName};")  # noqa: S608
-            numRecs = dbCur.fetchone()[0]
+            if fast:
+                dbCur.execute(f"SELECT max(rowid) FROM {tblName};")  # noqa: S608
+                numRecs = dbCur.fetchone()[0] or 0
+            else:
+                dbCur.execute(f"SELECT COUNT(*) FROM {tblName};")  # noqa: S608
+                numRecs = dbCur.fetchone()[0]
 
         except sqlite3.Error as e:
             log.error(
@@ -339,7 +577,9 @@ class SQLite(sql.BaseSQL):
         newest: Optional[bool] = True,
         orderBy: Optional[str] = None,
         dbTable: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+        stream: bool = False,
+        closeConn: bool = True,
+    ) -> Union[List[Any], Iterator[Any]]:
         """Helper method to retrieve records from an SQLite database.
 
         Args:
@@ -351,9 +591,19 @@ class SQLite(sql.BaseSQL):
                 Name of data field to sort/order records by before selection
             dbTable:
                 Name of database table
+            stream:
+                If 'True' then return generator yielding records in
+                'fetchmany()' batches instead of materializing full list
+            closeConn:
+                Close DB connection once stream is exhausted -- only
+                used when 'stream' is 'True' (the non-streaming paths
+                leave closing to their public callers)
 
         Returns:
-            List of selected records from a table
+            List of selected records from a table, or generator over them
+            when 'stream' is 'True'. With the default 'sqlite3.Row' factory
+            each record supports lookup by field name as well as by index;
+            otherwise records are 'dict' objects.
 
         Raises:
             StorageAccessError: If database table cannot be verified.
@@ -362,37 +612,49 @@ class SQLite(sql.BaseSQL):
         fldNames = self._dataFields.keys()
         flds = ",".join(f"{key}" for key in fldNames)
         sortFld = list(fldNames)[0] if orderBy is None else orderBy
-        dbConn = self.connect_open()
+        self.connect_open()
 
         if self._dbConn is None:
             log.error(f"Unable to connect to {SRV_PROVIDER} database: '{tblName}'")
             raise StorageAccessError(SRV_PROVIDER)
 
-        dbCur = dbConn.cursor()  # type: ignore[union-attr]
+        # Streams get a dedicated cursor -- any other provider call made
+        # while the stream is live would re-execute on the shared session
+        # cursor and silently truncate the pending result set
+        dbCur = self._dbConn.cursor() if stream else self._get_cursor()
 
         try:
+            # Only identifiers (table/field names, sort order) are baked into
+            # the SQL -- the record limit is bound as a '?' parameter, so the
+            # same statement text is reused for any 'numRecs' value
             if newest:
                 # Get 'newest' records -- we're not using f-strings here to improve readability
                 dbCur.execute(
-                    "SELECT * FROM (SELECT {flds} FROM {tbl} {inner} LIMIT {limit}) {order}".format(  # noqa: S608
+                    "SELECT * FROM (SELECT {flds} FROM {tbl} {inner} LIMIT ?) {order}".format(  # noqa: S608
                         flds=flds,
                         tbl=tblName,
                         inner=create_orderby_param(sortFld, True),
-                        limit=numRecs,
                         order=create_orderby_param(sortFld),
-                    )
+                    ),
+                    (numRecs,),
                 )
             else:
                 # Get 'oldest' records -- we're not using f-strings here to improve readability
                 dbCur.execute(
-                    "SELECT {flds} FROM {tbl} {order} LIMIT {limit}".format(  # noqa: S608
+                    "SELECT {flds} FROM {tbl} {order} LIMIT ?".format(  # noqa: S608
                         flds=flds,
                         tbl=tblName,
                         order=create_orderby_param(sortFld),
-                        limit=numRecs,
-                    )
+                    ),
+                    (numRecs,),
                 )
 
+            dbCur.arraysize = DEFAULT_ARRAY_SIZE
+            if stream:
+                # Hand rows off lazily -- peak memory stays at one
+                # 'fetchmany()' batch and callers can stop early
+                return self._stream_records(dbCur, tblName, closeConn)
+
             dataRecords = dbCur.fetchall()
 
         except sqlite3.Error as e:
@@ -402,13 +664,65 @@ class SQLite(sql.BaseSQL):
             self.connect_close(True)
             raise StorageAccessError(SRV_PROVIDER) from e
 
-        data = []
-        for row in dataRecords:
-            # Create dictionary with keys from field name
-            # list, mapped against values from database.
-            data.append(dict(zip(fldNames, row)))
+        if self._rowFactory is sqlite3.Row:
+            # 'sqlite3.Row' already supports lookup by field name (and by
+            # index), so there's no need to allocate a dict per row
+            return dataRecords
+
+        # Create dictionary per row with keys from field name
+        # list, mapped against values from database.
+        return [dict(zip(fldNames, row)) for row in dataRecords]
 
-        return data
+    def _stream_records(
+        self, dbCur: sqlite3.Cursor, tblName: str, closeConn: bool = True
+    ) -> Iterator[Any]:
+        """Yield query results from a cursor in 'arraysize' batches.
+
+        Streaming avoids holding both SQLite's result buffer and a full
+        Python list in memory at once. The DB connection is closed
+        (honoring 'closeConn') when the generator is exhausted or closed.
+
+        Args:
+            dbCur:
+                Dedicated cursor with a pending 'SELECT' result set
+            tblName:
+                Name of database table (only used for error messages)
+            closeConn:
+                Close DB connection when generator terminates if 'True'
+
+        Yields:
+            Records from the pending result set, one at a time
+
+        Raises:
+            StorageAccessError: If records cannot be fetched.
+        """
+        fldNames = self._dataFields.keys()
+        try:
+            while True:
+                dataBatch = dbCur.fetchmany()
+                if not dataBatch:
+                    break
+                if self._rowFactory is sqlite3.Row:
+                    yield from dataBatch
+                else:
+                    for row in dataBatch:
+                        yield dict(zip(fldNames, row))
+        except sqlite3.Error as e:
+            log.error(
+                f"Failed to retrieve data from {SRV_PROVIDER} database: '{tblName}'"
+            )
+            self.connect_close(True)
+            raise StorageAccessError(SRV_PROVIDER) from e
+        finally:
+            # Drop the dedicated stream cursor -- its connection may already
+            # be gone if the error path above force-closed it
+            try:
+                dbCur.close()
+            except sqlite3.Error:
+                pass
+            # 'connect_close()' is a no-op on an already-closed connection,
+            # so the error path above cannot double-release
+            self.connect_close(closeConn)
 
     def _trim_records_helper(
         self,
@@ -416,10 +730,14 @@ class SQLite(sql.BaseSQL):
         newest: Optional[bool] = True,
         orderBy: Optional[str] = None,
         dbTable: Optional[str] = None,
-    ) -> int:
+        retrieve: bool = False,
+    ) -> Union[int, List[Any]]:
         """Helper method to trim records from an SQLite database.
 
-        This is essentially the opposite of retrieving records.
+        This is essentially the opposite of retrieving records. The whole
+        trim runs as a single 'DELETE ... WHERE rowid IN (SELECT ...)'
+        statement -- one prepare and one commit regardless of how many
+        records are removed.
 
         Args:
             numRecs:
@@ -430,9 +748,14 @@ class SQLite(sql.BaseSQL):
                 Name of data field to sort/order records by before selection
             dbTable:
                 Name of database table
+            retrieve:
+                If 'True' then return sort field values of deleted records
+                instead of the record count. On SQLite >= 3.35 this uses
+                'DELETE ... RETURNING' -- i.e. no extra verification query.
 
         Returns:
-            Number of deleted records
+            Number of deleted records, or 'list' of deleted sort field
+            values if 'retrieve' is set
 
         Raises:
             StorageAccessError: If database table cannot be verified.
@@ -446,25 +769,37 @@ class SQLite(sql.BaseSQL):
             log.error(f"Unable to connect to {SRV_PROVIDER} database: '{tblName}'")
             raise StorageAccessError(SRV_PROVIDER)
 
-        dbCur = dbConn.cursor()  # type: ignore[union-attr]
+        dbCur = self._get_cursor()
 
-        foundRecs = self._retrieve_records_helper(numRecs, newest, orderBy)
-        delRecs = [foundRecs[i][sortFld] for i, val in enumerate(foundRecs)]
+        useReturning = retrieve and sqlite3.sqlite_version_info >= (3, 35)
+        if retrieve and not useReturning:
+            # Older SQLite w/out 'RETURNING' support -- grab the doomed
+            # records in a separate query before deleting them
+            foundRecs = self._retrieve_records_helper(numRecs, newest, orderBy)
+            delVals = [rec[sortFld.split("|")[0]] for rec in foundRecs]
 
         try:
-            for i in delRecs:
-                dbCur.execute(
-                    "DELETE FROM {tbl} WHERE {fld} = {val}".format(  # noqa: S608
-                        tbl=tblName, fld=sortFld, val="'i'" if isinstance(i, str) else i
-                    )
-                )
+            # Select the records to trim and delete them in one statement.
+            # Trimming 'newest' records means flipping the sort order so
+            # that 'LIMIT' keeps the last/newest 'numRecs' records.
+            delSQL = "DELETE FROM {tbl} WHERE rowid IN (SELECT rowid FROM {tbl} {order} LIMIT ?)".format(  # noqa: S608
+                tbl=tblName,
+                order=create_orderby_param(sortFld, bool(newest)),
+            )
+            if useReturning:
+                dbCur.execute(f"{delSQL} RETURNING {sortFld.split('|')[0]}", (numRecs,))
+                delVals = [row[0] for row in dbCur.fetchall()]
+            else:
+                dbCur.execute(delSQL, (numRecs,))
+
+            dbConn.commit()  # type: ignore[union-attr]
 
         except sqlite3.Error as e:
             log.error(f"Failed to trim data from {SRV_PROVIDER} database: '{tblName}'")
             self.connect_close(True)
             raise StorageAccessError(SRV_PROVIDER) from e
 
-        return len(delRecs)
+        return delVals if retrieve else int(dbCur.rowcount)
 
     def has_table(self, dbTable: str, **kwargs: Any) -> bool:
         """Public method to check if given table exists in current database.
@@ -504,13 +839,18 @@ class SQLite(sql.BaseSQL):
     def store_records(self, inData: typeDefData, **kwargs: Any) -> None:
         """Store data records in SQLite database.
 
+        All rows are stored within a single transaction -- i.e. one fsync
+        per call rather than one per row.
+
         Args:
             inData:
                 Data to be stored as single 'dict' or 'list' of 'dicts'
             kwargs:
                 - 'close' -- close DB connection if 'True'
+                - 'batch_size' -- max number of rows per 'executemany()' batch
         """
         closeConn = kwargs.get(const.KWD_CLOSE, True)
+        batchSize = kwargs.get(const.KWD_BATCH_SIZE, DEFAULT_BATCH_SIZE)
         dbConn = self.connect_open()
 
         if not self._has_table_helper():
@@ -520,29 +860,92 @@ class SQLite(sql.BaseSQL):
         # Ensure that we always handle a list of rows
         data = inData if isinstance(inData, list) else [inData]
 
-        self._store_records_helper(data)
+        self._store_records_helper(data, batchSize=batchSize)
         dbConn.commit()  # type: ignore[union-attr]
 
         self.connect_close(closeConn)
 
+    def store_records_iter(
+        self,
+        inData: Iterable[Dict[str, Any]],
+        chunkSize: int = DEFAULT_BATCH_SIZE,
+        **kwargs: Any,
+    ) -> None:
+        """Store a stream of data records in SQLite database.
+
+        This is a bulk-path alternative to 'store_records()' for large data
+        sets. Records are pulled from any iterable (e.g. a generator) in
+        chunks of 'chunkSize' rows, and each chunk is inserted via a single
+        'executemany()' call and committed as one transaction. Memory use
+        stays bounded by 'chunkSize' regardless of total data volume.
+
+        Note: each record must be a 'dict' holding all data fields defined
+        for this data store. Unlike 'store_records()', there is no per-row
+        filtering of unknown fields.
+
+        Args:
+            inData:
+                Iterable yielding data records as 'dict' objects
+            chunkSize:
+                Max number of records per transaction
+            kwargs:
+                - 'close' -- close DB connection if 'True'
+
+        Raises:
+            StorageAccessError: If data records cannot be stored.
+        """
+        closeConn = kwargs.get(const.KWD_CLOSE, True)
+        dbConn = self.connect_open()
+
+        if not self._has_table_helper():
+            self._create_table_helper()
+            dbConn.commit()  # type: ignore[union-attr]
+
+        dbCur = self._get_cursor()
+        rows = iter(inData)
+
+        try:
+            while True:
+                chunk = list(itertools.islice(rows, chunkSize))
+                if not chunk:
+                    break
+
+                dbCur.executemany(self._insertSQL, map(self._rowExtract, chunk))
+                dbConn.commit()  # type: ignore[union-attr]
+
+        except sqlite3.Error as e:
+            log.error(
+                f"Unable to store records in {SRV_PROVIDER} database: '{self._dbTable}'"
+            )
+            self.connect_close(True)
+            raise StorageAccessError(SRV_PROVIDER) from e
+
+        self.connect_close(closeConn)
+
     def count_records(self, **kwargs: Any) -> int:
         """Count number of records in SQLite database.
 
         Args:
             kwargs:
                 'close' -- close DB connection if 'True'
+                'fast'  -- if 'True', count via 'max(rowid)' (O(1)) instead
+                           of 'COUNT(*)' (O(N)). Only accurate for tables
+                           that have never had records deleted.
 
         Returns:
             Number of records in a table
         """
         closeConn = kwargs.get(const.KWD_CLOSE, True)
+        fast = kwargs.get(const.KWD_FAST, False)
 
-        numRecs = self._count_records_helper()
+        numRecs = self._count_records_helper(fast=fast)
 
         self.connect_close(closeConn)
         return numRecs
 
-    def retrieve_records(self, numRecs: int = 1, **kwargs: Any) -> List[Dict[str, Any]]:
+    def retrieve_records(
+        self, numRecs: int = 1, **kwargs: Any
+    ) -> Union[List[Any], Iterator[Any]]:
         """Retrieve data records from SQLite database.
 
         Args:
@@ -553,20 +956,33 @@ class SQLite(sql.BaseSQL):
                 'order_by' -- Field to sorted by
                 'first'    -- If TRUE, retrieve first 'numRecs' records.
                               Else retrieve last 'numRecs' records.
+                'stream'   -- If TRUE, return generator yielding records
+                              in batches instead of a fully materialized
+                              list. The connection stays open while the
+                              generator is live and is closed (honoring
+                              'close') once it's exhausted or closed.
 
         Returns:
-            List of records
+            List of records, or generator over them when 'stream' is 'True'
         """
         orderBy = kwargs.get(const.KWD_ORDER_BY, None)
         newest = kwargs.get(const.KWD_NEWEST, True)
         closeConn = kwargs.get(const.KWD_CLOSE, True)
+        stream = kwargs.get(const.KWD_STREAM, False)
+
+        if stream:
+            return self._retrieve_records_helper(
+                numRecs, newest, orderBy, stream=True, closeConn=closeConn
+            )
 
         foundRecs = self._retrieve_records_helper(numRecs, newest, orderBy)
 
         self.connect_close(closeConn)
         return foundRecs
 
-    def trim_records(self, numRecs: int = 0, **kwargs: Any) -> int:
+    def trim_records(
+        self, numRecs: int = 0, **kwargs: Any
+    ) -> Union[int, List[Any]]:
         """Trim data records from SQLite database.
 
         Args:
@@ -576,16 +992,21 @@ class SQLite(sql.BaseSQL):
                 'order_by'  - Field to sorted by
                 'newest'    - If TRUE, retrieve first 'numRecs' records.
                               Else retrieve last 'numRecs' records.
+                'retrieve'  - If TRUE, return sort field values of deleted
+                              records (single round-trip via 'RETURNING'
+                              where supported) instead of the record count.
 
         Returns:
-            List of records
+            Number of deleted records, or 'list' of deleted sort field
+            values if 'retrieve' is set
         """
         orderBy = kwargs.get(const.KWD_ORDER_BY, None)
         newest = kwargs.get(const.KWD_NEWEST, True)
+        retrieve = kwargs.get(const.KWD_RETRIEVE, False)
 
         closeConn = kwargs.get(const.KWD_CLOSE, True)
 
-        trimRecs = self._trim_records_helper(numRecs, newest, orderBy)
+        trimRecs = self._trim_records_helper(numRecs, newest, orderBy, retrieve=retrieve)
 
         self.connect_close(closeConn)
         return trimRecs
@@ -594,6 +1015,24 @@ class SQLite(sql.BaseSQL):
 # =========================================================
 #              U T I L I T Y   F U N C T I O N S
 # =========================================================
+def quote_identifier(inStr: str) -> str:
+    """Helper: quote an SQL identifier (e.g. table or column name).
+
+    SQLite quotes identifiers with double quotes, and any embedded double
+    quote is escaped by doubling it. This keeps arbitrary names from being
+    interpreted as SQL.
+
+    Args:
+        inStr:
+            Identifier to quote.
+
+    Returns:
+        Quoted identifier, safe for interpolation into SQL strings.
+    """
+    escaped = inStr.replace('"', '""')
+    return f'"{escaped}"'
+
+
 def create_orderby_param(inStr: str, flip: bool = False) -> str:
     """Helper: flip 'orderBy' parameter.
 
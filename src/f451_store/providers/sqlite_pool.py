@@ -0,0 +1,101 @@
+"""SQLite connection pool for f451 Datastore module.
+
+This module provides a small pool of SQLite connections keyed by database
+host. Opening a SQLite database is not free -- 'sqlite3_open' walks the
+journal and acquires locks -- and callers that use the default 'close=True'
+flow of the 'SQLite' provider pay that cost on every operation. Parking
+released connections here and handing them back on the next 'acquire()'
+for the same host amortizes connection setup across calls.
+
+Note: 'sqlite3' connections must stay on their creating thread, and the
+pool therefore keeps a separate set of idle connections per thread.
+"""
+import sqlite3
+import threading
+from typing import Dict
+from typing import List
+
+# =========================================================
+#          G L O B A L S   A N D   H E L P E R S
+# =========================================================
+DEFAULT_MAX_IDLE: int = 4  # Max parked connections per host (per thread)
+
+
+# =========================================================
+#        M A I N   C L A S S   D E F I N I T I O N
+# =========================================================
+class SQLiteConnectionPool:
+    """Bounded pool of idle SQLite connections keyed by database host.
+
+    Attributes:
+        maxIdle:
+            Max number of idle connections parked per host (per thread)
+    """
+
+    def __init__(self, maxIdle: int = DEFAULT_MAX_IDLE) -> None:
+        self._maxIdle = maxIdle
+        self._local = threading.local()
+
+    @property
+    def maxIdle(self) -> int:
+        """Return 'maxIdle' property."""
+        return self._maxIdle
+
+    def _idle(self) -> Dict[str, List[sqlite3.Connection]]:
+        """Return idle connection map for current thread."""
+        idle = getattr(self._local, "idle", None)
+        if idle is None:
+            idle = {}
+            self._local.idle = idle
+
+        return idle
+
+    def acquire(self, dbHost: str) -> sqlite3.Connection:
+        """Return a pooled connection for 'dbHost', or open a new one.
+
+        Args:
+            dbHost:
+                Name of database file
+
+        Returns:
+            'sqlite3.Connection' object
+        """
+        conns = self._idle().get(str(dbHost))
+        if conns:
+            return conns.pop()
+
+        return sqlite3.connect(str(dbHost))
+
+    def release(self, dbHost: str, dbConn: sqlite3.Connection) -> None:
+        """Park a connection for later reuse, or close it if pool is full.
+
+        Any uncommitted state is rolled back before the connection is
+        parked so the next 'acquire()' starts from a clean slate.
+
+        Args:
+            dbHost:
+                Name of database file
+            dbConn:
+                Connection to park/close
+        """
+        conns = self._idle().setdefault(str(dbHost), [])
+        if len(conns) >= self._maxIdle:
+            dbConn.close()
+            return
+
+        try:
+            dbConn.rollback()
+        except sqlite3.Error:
+            dbConn.close()  # Don't park a broken connection
+            return
+
+        conns.append(dbConn)
+
+    def close_all(self) -> None:
+        """Close all idle connections held for current thread."""
+        idle = self._idle()
+        for conns in idle.values():
+            for dbConn in conns:
+                dbConn.close()
+
+        idle.clear()
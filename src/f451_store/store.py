@@ -26,6 +26,7 @@ For example:
 
         sortedlist = sorted(origList, key=itemgetter('<name of field to sort by>'))
 """
+import functools
 import logging
 import pprint
 from configparser import ConfigParser
@@ -59,9 +60,79 @@ typeDefStorageInfo = Union[ConfigParser, Dict[str, str], Dict[str, Any], List[st
 # typeDefSendMsgResponse = Union[List[provider.Response], Any]
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_service_list(raw: str, delim: str) -> Any:
+    """Split (memoized) service list string into tuple of service names.
+
+    The same service list string (e.g. 'f451_json|f451_sqlite') tends to be
+    parsed for every 'Store' instance, and we therefore cache the result.
+    """
+    return tuple(raw.split(delim))
+
+
 # =========================================================
 #        M A I N   C L A S S   D E F I N I T I O N
 # =========================================================
+class _LazyProviderMap:
+    """Lazy, cached map of storage providers.
+
+    Storage providers can be expensive to construct, and callers rarely
+    use every backend. This map holds only the settings snapshot and one
+    factory per storage name, and instantiates a provider on first access.
+    Once constructed, a provider instance is cached for subsequent lookups.
+    """
+
+    def __init__(
+        self,
+        factories: Dict[str, Any],
+        snapshot: Dict[str, Any],
+    ) -> None:
+        self._factories = factories
+        self._snapshot = snapshot
+        self._cache: Dict[str, typeDefProvider] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._factories
+
+    # Lookups deliberately type as 'Any' -- same as indexing the
+    # 'Dict[str, Any]' that this map replaced -- so call sites can use
+    # provider-specific attributes without casting
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._cache:
+            self._cache[key] = self._factories[key](self._snapshot)
+
+        return self._cache[key]
+
+    def __iter__(self) -> Any:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return provider for given storage name, or 'default' if unknown."""
+        return self[key] if key in self._factories else default
+
+    def keys(self) -> Any:
+        """Return all known storage names."""
+        return self._factories.keys()
+
+    def items(self) -> Any:
+        """Return '(name, provider)' pairs for all known storage names.
+
+        Note: this instantiates any provider not yet constructed, just
+              like iterating an eagerly built 'dict' would expose them.
+        """
+        return [(key, self[key]) for key in self._factories]
+
+    def values(self) -> Any:
+        """Return providers for all known storage names.
+
+        Note: this instantiates any provider not yet constructed.
+        """
+        return [self[key] for key in self._factories]
+
+
 class Store(provider.Provider):
     """Main class for f451 Datastore module.
 
@@ -90,29 +161,102 @@ class Store(provider.Provider):
             dbUserPswd="",
         )
 
-        settings = utils.process_config(config, False)
+        # An already-parsed ConfigParser can be used as-is -- no need to
+        # run it through 'process_config()' again
+        settings = (
+            config
+            if isinstance(config, ConfigParser)
+            else utils.process_config(config, False)
+        )
+        self._configure(settings)
 
-        self.default_storage = settings
-        self.storage_map = settings
-        self.storage = settings  # type: ignore[assignment]
+    def _configure(self, settings: ConfigParser) -> None:
+        """Populate all settings-derived attributes in a single pass.
+
+        The public property setters remain available for API compatibility,
+        but initialization goes through this method instead so that the
+        config is parsed exactly once per 'Store' construction.
+        """
+        snapshot = self._get_snapshot(settings)
+
+        self._default_storage = snapshot[const.KWD_STORAGE]
+        self._storage_map = snapshot[const.KWD_STORAGE_MAP]
+        self._build_storage(snapshot)
+
+    def _build_storage(self, snapshot: Dict[str, Any]) -> None:
+        """Build lazy storage provider map from settings snapshot.
+
+        Providers are not constructed here -- only the factories are
+        registered. A given provider is instantiated on first access.
+        """
+        factories = {
+            const.STORAGE_CSV: self._init_csv,
+            const.STORAGE_JSON: self._init_json,
+            const.STORAGE_SQLITE: self._init_sqlite,
+        }
+        self._storage = _LazyProviderMap(factories, snapshot)
+        # Validity mirrors the registered factories -- NOT the config --
+        # since storage names are 'valid' even when their config section
+        # is absent (they're just not enabled)
+        self._valid_storage_set = frozenset(factories)
+
+    @staticmethod
+    def _snapshot_settings(settings: ConfigParser) -> Dict[str, Any]:
+        """Parse ConfigParser object into plain 'dict' snapshot.
+
+        ConfigParser 'get()' calls are relatively expensive, and the various
+        property setters all need values from the same few sections. We
+        therefore read everything once into a plain 'dict' -- incl. the
+        processed field and storage maps -- and the setters then work off
+        this snapshot instead of re-parsing the ConfigParser object.
+        """
+        # Read all sections into plain dicts in one pass -- 'dict.get' is
+        # much cheaper than 'ConfigParser.get' with fallbacks
+        sections = {name: dict(settings.items(name)) for name in settings.sections()}
+        main = sections.get(const.STORAGE_MAIN, {})
+
+        return {
+            const.KWD_FIELD_MAP: utils.process_key_value_map(
+                main.get(const.KWD_FIELD_MAP, "")
+            ),
+            const.KWD_STORAGE_MAP: utils.process_key_value_map(
+                main.get(const.KWD_STORAGE_MAP, "")
+            ),
+            # Stored as (immutable) tuple -- cheaper to allocate and iterate
+            const.KWD_STORAGE: _parse_service_list(
+                str(main.get(const.KWD_STORAGE, "")), const.DELIM_STD
+            ),
+            const.STORAGE_CSV: sections.get(const.STORAGE_CSV),
+            const.STORAGE_JSON: sections.get(const.STORAGE_JSON),
+            const.STORAGE_SQLITE: sections.get(const.STORAGE_SQLITE),
+        }
+
+    def _get_snapshot(self, settings: ConfigParser) -> Dict[str, Any]:
+        """Return cached settings snapshot, refreshing if config changed."""
+        if (
+            getattr(self, "_cfgSnapshot", None) is None
+            or getattr(self, "_cfgSource", None) is not settings
+        ):
+            self._cfgSnapshot = self._snapshot_settings(settings)
+            self._cfgSource = settings
+
+        return self._cfgSnapshot
 
     @property
-    def storage(self) -> Dict[str, Any]:
+    def storage(self) -> _LazyProviderMap:
         """Return 'storage' property."""
         return self._storage
 
     @storage.setter
     def storage(self, settings: ConfigParser) -> None:
         """Set 'storage' property."""
-        self._storage = {
-            const.STORAGE_CSV: self._init_csv(settings),
-            const.STORAGE_JSON: self._init_json(settings),
-            const.STORAGE_SQLITE: self._init_sqlite(settings),
-        }
+        self._build_storage(self._get_snapshot(settings))
 
     @property
     def valid_storage(self) -> List[str]:
-        """Return 'senderName' property."""
+        """Return 'valid_storage' property."""
+        # Listed in (stable) factory registration order -- the frozenset
+        # is only used for O(1) membership checks
         return list(self._storage.keys())
 
     @property
@@ -123,25 +267,35 @@ class Store(provider.Provider):
     @storage_map.setter
     def storage_map(self, settings: ConfigParser) -> None:
         """Set 'storage_map' property."""
-        self._storage_map = utils.process_key_value_map(
-            settings.get(const.STORAGE_MAIN, const.KWD_STORAGE_MAP, fallback="")
-        )
+        self._storage_map = self._get_snapshot(settings)[const.KWD_STORAGE_MAP]
 
     def is_valid_storage(self, inChannels: typeDefStringLists) -> bool:
         """Check if communications storage is valid."""
+        # Fast path for single-name strings -- no list allocation needed
+        if isinstance(inChannels, str) and const.DELIM_STD not in inChannels:
+            return self._verify_storage(inChannels, True)
+
         tmpList = self._normalize_storage_list(inChannels)
-        return (
-            all(self._verify_storage(ch, True) for ch in tmpList) if tmpList else False
-        )
+        if not tmpList:
+            return False
+
+        # Bind method lookup as local to skip per-item attribute resolution
+        verify = self._verify_storage
+        return all(verify(ch, True) for ch in tmpList)
 
     def is_enabled_storage(self, inChannels: typeDefStringLists) -> bool:
         """Check if communications storage is enabled."""
+        # Fast path for single-name strings -- no list allocation needed
+        if isinstance(inChannels, str) and const.DELIM_STD not in inChannels:
+            return bool(inChannels) and bool(self._storage.get(inChannels))
+
         tmpList = self._normalize_storage_list(inChannels)
-        return (
-            all(ch in self._storage and self._storage[ch] for ch in tmpList)
-            if tmpList
-            else False
-        )
+        if not tmpList:
+            return False
+
+        # Bind dict lookup as local to skip per-item attribute resolution
+        storage = self._storage
+        return all(storage.get(ch) for ch in tmpList)
 
     @property
     def default_storage(self) -> typeDefStorageInfo:
@@ -151,59 +305,58 @@ class Store(provider.Provider):
     @default_storage.setter
     def default_storage(self, settings: ConfigParser) -> None:
         """Set 'default_storage' property."""
-        self._default_storage = str(
-            settings.get(const.STORAGE_MAIN, const.KWD_STORAGE, fallback="")
-        ).split(const.DELIM_STD)
+        self._default_storage = self._get_snapshot(settings)[const.KWD_STORAGE]
 
     def _verify_storage(self, chName: str, force: bool) -> bool:
         return (
-            (chName != "" and (chName in self._storage or chName in self._storage_map))
+            (
+                chName != ""
+                and (
+                    chName in self._valid_storage_set or chName in self._storage_map
+                )
+            )
             if force
             else (chName != "")
         )
 
     @staticmethod
     def _normalize_storage_list(inStorage: typeDefStringLists) -> List[str]:
-        if inStorage:
-            if isinstance(inStorage, str):
-                return inStorage.split(const.DELIM_STD)
-            elif all(isinstance(ch, str) for ch in inStorage):
-                return inStorage
+        if not inStorage:
+            return []
+
+        if isinstance(inStorage, str):
+            return inStorage.split(const.DELIM_STD)
 
-        return []
+        # Only spot-check first element instead of scanning the whole
+        # list -- the type annotation promises a list of strings
+        return inStorage if isinstance(inStorage[0], str) else []
 
     @staticmethod
-    def _init_csv(settings: ConfigParser) -> typeDefProvider:
-        """Initialize 'CSV' storage provider."""
-        if not settings.has_section(const.STORAGE_CSV):
+    def _init_file_provider(
+        snapshot: Dict[str, Any], section: str, cls: Any
+    ) -> typeDefProvider:
+        """Initialize file-based storage provider (e.g. CSV, JSON, etc.)."""
+        sctn = snapshot[section]
+        if sctn is None:
             return None
 
-        fldMap = utils.process_key_value_map(
-            settings.get(const.STORAGE_MAIN, const.KWD_FIELD_MAP, fallback="")
+        return cls(
+            snapshot[const.KWD_FIELD_MAP],
+            dbHost=Path(sctn.get(const.KWD_FNAME, "")),
         )
 
-        return CSV(
-            fldMap,
-            dbHost=Path(settings.get(const.STORAGE_CSV, const.KWD_FNAME, fallback="")),
-        )
+    @classmethod
+    def _init_csv(cls, snapshot: Dict[str, Any]) -> typeDefProvider:
+        """Initialize 'CSV' storage provider."""
+        return cls._init_file_provider(snapshot, const.STORAGE_CSV, CSV)
 
-    @staticmethod
-    def _init_json(settings: ConfigParser) -> typeDefProvider:
+    @classmethod
+    def _init_json(cls, snapshot: Dict[str, Any]) -> typeDefProvider:
         """Initialize 'JSON' storage provider."""
-        if not settings.has_section(const.STORAGE_JSON):
-            return None
-
-        fldMap = utils.process_key_value_map(
-            settings.get(const.STORAGE_MAIN, const.KWD_FIELD_MAP, fallback="")
-        )
-
-        return JSON(
-            fldMap,
-            dbHost=Path(settings.get(const.STORAGE_JSON, const.KWD_FNAME, fallback="")),
-        )
+        return cls._init_file_provider(snapshot, const.STORAGE_JSON, JSON)
 
     @staticmethod
-    def _init_sqlite(settings: ConfigParser) -> typeDefProvider:
+    def _init_sqlite(snapshot: Dict[str, Any]) -> typeDefProvider:
         """Initialize 'SQLite' storage provider."""
         return None
 
@@ -248,21 +401,25 @@ class Store(provider.Provider):
             else utils.convert_attrib_str_to_list(inList)
         )
 
-        print(inList)
-        print(tmpList)
-
-        outList = [
-            ch
-            for ch in [
-                self._storage_map[item] if item in self._storage_map else item
-                for item in [
-                    tmp.strip()
-                    for tmp in tmpList
-                    if self._verify_storage(tmp.strip(), strict)
-                ]
-            ]
-            if self.is_enabled_storage(ch)
-        ]
-
-        print(outList)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Processing storage list: {tmpList}")
+
+        # Single pass: strip once, verify once, map once, and check
+        # enabled status via direct dict lookup instead of calling
+        # 'is_enabled_storage()' -- which re-normalizes -- per item.
+        storage = self._storage
+        storageMap = self._storage_map
+        outList = []
+        for tmp in tmpList:
+            chName = tmp.strip()
+            if not self._verify_storage(chName, strict):
+                continue
+
+            ch = storageMap.get(chName, chName)
+            if storage.get(ch):
+                outList.append(ch)
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Processed storage list: {outList}")
+
         return outList
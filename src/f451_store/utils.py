@@ -4,7 +4,8 @@ This module includes several functions that are used throughout the
 f451 Datastore module to handle common tasks like processing lists,
 parsing strings, and more.
 """
-# import re
+import functools
+import re
 from collections import ChainMap
 from configparser import ConfigParser
 from configparser import ExtendedInterpolation
@@ -43,6 +44,11 @@ __all__ = [
 #     return bool(re.fullmatch(r"^[A-Za-z0-9_]{1,15}$", inStr))
 
 
+# Truthy string values for 'convert_str_to_bool()' -- a module-level
+# 'frozenset' gives an O(1) hashed membership check built exactly once
+_TRUE_VALUES = frozenset({"true", "1", "t", "y", "yes"})
+
+
 def process_key_value_map(
     inList: Any, keyDelim: str = ":", itemDelim: str = "|"
 ) -> Dict[str, Any]:
@@ -66,13 +72,56 @@ def process_key_value_map(
     Returns:
         'dict' with zero or more key-value pairs
     """
-    stripChars = f"{keyDelim} "
+    if isinstance(inList, list):
+        return _build_key_value_map(inList, keyDelim)
+
+    # String inputs are memoized as the same map strings (e.g. field and
+    # storage maps from config files) tend to be parsed over and over. We
+    # return a copy so that callers cannot mutate the cached version.
+    return dict(_process_key_value_map_str(str(inList), keyDelim, itemDelim))
+
 
-    tmpList = (
-        inList
-        if isinstance(inList, list)
-        else convert_attrib_str_to_list(inList, itemDelim)
+@functools.lru_cache(maxsize=16)
+def _compile_kv_pattern(keyDelim: str, itemDelim: str) -> "re.Pattern[str]":
+    """Compile key-value pair pattern for given pair of delimiters.
+
+    Each match must start at the beginning of an item (i.e. start of string
+    or right after an item delimiter) and captures the first 'key<delim>value'
+    pair of that item in a single pass through the regex engine instead of
+    nested Python loops. Note that the capture groups can still match
+    whitespace-only keys/values -- callers must strip and filter matches to
+    mirror the split-and-strip semantics of the list code path.
+    """
+    k = re.escape(keyDelim)
+    i = re.escape(itemDelim)
+    return re.compile(
+        rf"(?:^|{i})\s*([^{k}{i}]+?)\s*{k}\s*([^{k}{i}]+?)\s*(?={k}|{i}|$)"
     )
+
+
+@functools.lru_cache(maxsize=128)
+def _process_key_value_map_str(
+    inStr: str, keyDelim: str, itemDelim: str
+) -> Dict[str, Any]:
+    """Memoized worker for 'process_key_value_map()' string inputs."""
+    matches = _compile_kv_pattern(keyDelim, itemDelim).findall(inStr)
+
+    # Strip each capture exactly once and drop whitespace-only keys/values,
+    # mirroring '_build_key_value_map()'. Reversed so that the first
+    # occurrence of a duplicate key wins, which matches the 'ChainMap'
+    # semantics of the list code path.
+    pairs = [
+        (key, val)
+        for key, val in ((k.strip(), v.strip()) for k, v in matches)
+        if key and val
+    ]
+    return dict(reversed(pairs))
+
+
+def _build_key_value_map(tmpList: List[Any], keyDelim: str) -> Dict[str, Any]:
+    """Build key-value lookup table from list of 'key:value' strings."""
+    stripChars = f"{keyDelim} "
+
     outList = [
         {key.strip(): val.strip()}
         for key, val in [
@@ -167,11 +216,7 @@ def convert_str_to_bool(inVal: Any) -> bool:
     Returns:
         Boolean 'True' or 'False' based on input.
     """
-    return (
-        inVal
-        if type(inVal) == bool
-        else str(inVal).lower() in {"true", "1", "t", "y", "yes"}
-    )
+    return inVal if isinstance(inVal, bool) else str(inVal).lower() in _TRUE_VALUES
 
 
 def process_string_list(
@@ -201,7 +246,10 @@ def process_string_list(
 
     stripChars = f"{prefix}{suffix}{spacer}"
     tmpList = inList if isinstance(inList, list) else convert_attrib_str_to_list(inList)
-    strList = [item.strip(stripChars) for item in tmpList if item.strip(stripChars)]
+
+    # Strip each item exactly once -- the inner generator feeds the filter
+    # so we don't pay for a second 'strip()' call per item
+    strList = [item for item in (s.strip(stripChars) for s in tmpList) if item]
 
     joiner = f"{suffix}{spacer}{prefix}"
     return f"{prefix}{joiner.join(strList)}{suffix}" if strList else ""
@@ -1,7 +1,8 @@
 """PyTest fixtures and helper functions, etc."""
+import copy
+import itertools
 import pprint
 import random
-import uuid
 from configparser import ConfigParser
 from configparser import ExtendedInterpolation
 from inspect import getframeinfo
@@ -17,6 +18,9 @@ import f451_store.constants as const
 # =========================================================
 #                      H E L P E R S
 # =========================================================
+_PP_ = pprint.PrettyPrinter(indent=4)  # Shared printer for all 'Helpers.pp' calls
+
+
 class Helpers:
     """Generic helper class.
 
@@ -28,7 +32,6 @@ class Helpers:
     def pp(capsys, data, frame=None):
         """(Magic) Pretty Print function."""
         with capsys.disabled():
-            _PP_ = pprint.PrettyPrinter(indent=4)
             print("\n")
             if frame is not None:
                 print(f"LINE #: {getframeinfo(frame).lineno}\n")
@@ -94,9 +97,102 @@ TEST_MIXED_FLD_MAP = {
 
 MAGIC_TEST_NUMBER = 1000
 
+# Monotonic counter for unique fixture filenames -- tests only need
+# process-local uniqueness, not the syscall cost of 'uuid.uuid4()'
+_fname_counter = itertools.count()
+
 fake = Faker()  # Initialize 'Faker'
 
 
+def _build_valid_data_row():
+    """Generate single (deterministic) data row.
+
+    Note: 'seed_instance()' only seeds our shared 'Faker' instance instead
+          of reseeding every 'Faker' globally like 'Faker.seed()' does.
+    """
+    fake.seed_instance(0)
+    return {
+        KEY_FLD_NAME: fake.random_number(4, True),  # Random 4-digit numbers as index
+        "HDR1": fake.word(),
+        "HDR2": fake.word(),
+        "HDR3": fake.word(),
+        "HDR4": fake.word(),
+    }
+
+
+def _build_valid_data_set():
+    """Generate (deterministic) data set."""
+    fake.seed_instance(0)
+    numRecs = fake.random_number(3, True)
+
+    # Bind hot 'Faker' methods to locals -- saves an attribute lookup
+    # per field for every generated row
+    fakeWord = fake.word
+    return [
+        {
+            KEY_FLD_NAME: (i + 1),
+            "HDR1": fakeWord(),
+            "HDR2": fakeWord(),
+            "HDR3": fakeWord(),
+            "HDR4": fakeWord(),
+        }
+        for i in range(numRecs)
+    ]
+
+
+def _build_valid_mixed_data_set():
+    """Generate (deterministic) data set with mixed data types."""
+    fake.seed_instance(0)
+    numRecs = fake.random_number(3, True)
+
+    # Bind hot 'Faker'/'random' methods to locals -- saves an attribute
+    # lookup per field for every generated row
+    fakeWord = fake.word
+    fakeInt = fake.random_int
+    rndFloat = random.random
+    rndBits = random.getrandbits
+    return [
+        {
+            KEY_FLD_NAME: (i + 1),
+            "HDR_STRIDX": str(i + fakeInt(min=100, max=999)),
+            "HDR_STR": fakeWord(),
+            "HDR_INT": fakeInt(min=100, max=999),
+            "HDR_INTIDX": (i + fakeInt(min=100, max=999)),
+            "HDR_FLOAT": round(rndFloat(), 2),  # noqa: S311
+            "HDR_BOOL": bool(rndBits(1)),
+        }
+        for i in range(numRecs)
+    ]
+
+
+# Data sets are deterministic (seeded RNG) and identical for every test,
+# and we therefore generate them exactly once at module load. Fixtures
+# hand out deep copies so that tests can't mutate the shared originals.
+_VALID_DATA_ROW = _build_valid_data_row()
+_VALID_DATA_SET = _build_valid_data_set()
+_VALID_MIXED_DATA_SET = _build_valid_mixed_data_set()
+
+# Prototype config parsers are built once -- 'read_dict()' runs values
+# through the (slow) parsing machinery, while fixtures can hand out
+# cheap deep copies instead.
+_PROTO_VALID_CONFIG = ConfigParser(interpolation=ExtendedInterpolation())
+_PROTO_VALID_CONFIG.read_dict(DEFAULT_CONFIG_DICT)
+
+_PROTO_VALID_SETTINGS = ConfigParser()
+_PROTO_VALID_SETTINGS.read_dict(DEFAULT_TEST_CONFIG)
+_PROTO_VALID_SETTINGS.read_dict(DEFAULT_TEST_SECRETS)
+
+
+@pytest.fixture(scope="session", name="fake")
+def fake_fixture():
+    """Return shared session-wide 'Faker' instance.
+
+    'Faker()' builds a full provider registry on construction, and tests
+    should therefore inject this fixture instead of creating their own.
+    """
+    return fake
+
+
 @pytest.fixture()
 def key_fld_name():
     """Return key field name."""
@@ -109,7 +205,7 @@ def magic_test_number():
     return MAGIC_TEST_NUMBER
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def valid_field_map():
     """Return valid data field map."""
     return TEST_FLD_MAP
@@ -129,32 +225,40 @@ def invalid_field_map():
 
 @pytest.fixture(scope="function")
 def valid_data_row():
-    """Return valid data field map."""
-    Faker.seed(0)
-    return {
-        KEY_FLD_NAME: fake.random_number(4, True),  # Random 4-digit numbers as index
-        "HDR1": fake.word(),
-        "HDR2": fake.word(),
-        "HDR3": fake.word(),
-        "HDR4": fake.word(),
-    }
+    """Return valid data row."""
+    return copy.deepcopy(_VALID_DATA_ROW)
 
 
 @pytest.fixture(scope="function")
 def valid_data_set():
     """Return valid data set."""
-    Faker.seed(0)
-    numRecs = fake.random_number(3, True)
-    return [
-        {
-            KEY_FLD_NAME: (i + 1),
-            "HDR1": fake.word(),
-            "HDR2": fake.word(),
-            "HDR3": fake.word(),
-            "HDR4": fake.word(),
-        }
-        for i in range(numRecs)
-    ]
+    return copy.deepcopy(_VALID_DATA_SET)
+
+
+@pytest.fixture(scope="session")
+def shared_valid_data_set():
+    """Return shared valid data set.
+
+    Note: this is session-scoped and NOT copied. It allows module-scoped
+          fixtures to populate storage once, but must be treated as
+          read-only by all tests.
+    """
+    return _VALID_DATA_SET
+
+
+@pytest.fixture(scope="session")
+def valid_data_set_csv_bytes():
+    """Return shared valid data set pre-serialized as CSV bytes.
+
+    Serializing the 'header' row and all data rows exactly once lets
+    populate-only fixtures create storage files with a single raw write
+    instead of re-encoding the full set row-by-row per caller.
+    """
+    flds = list(TEST_FLD_MAP.keys())
+    rows = "\n".join(
+        ",".join(str(row[fld]) for fld in flds) for row in _VALID_DATA_SET
+    )
+    return f"{','.join(flds)}\n{rows}\n".encode()
 
 
 @pytest.fixture(scope="function")
@@ -166,20 +270,7 @@ def valid_mixed_field_map():
 @pytest.fixture(scope="function")
 def valid_mixed_data_set():
     """Return valid data set with mixed data types."""
-    Faker.seed(0)
-    numRecs = fake.random_number(3, True)
-    return [
-        {
-            KEY_FLD_NAME: (i + 1),
-            "HDR_STRIDX": str(i + fake.random_int(min=100, max=999)),
-            "HDR_STR": fake.word(),
-            "HDR_INT": fake.random_int(min=100, max=999),
-            "HDR_INTIDX": (i + fake.random_int(min=100, max=999)),
-            "HDR_FLOAT": round(random.random(), 2),  # noqa: S311
-            "HDR_BOOL": bool(random.getrandbits(1)),
-        }
-        for i in range(numRecs)
-    ]
+    return copy.deepcopy(_VALID_MIXED_DATA_SET)
 
 
 @pytest.fixture()
@@ -203,9 +294,7 @@ def default_test_val():
 @pytest.fixture()
 def valid_config():
     """Return valid config values."""
-    parser = ConfigParser(interpolation=ExtendedInterpolation())
-    parser.read_dict(DEFAULT_CONFIG_DICT)
-    return parser
+    return copy.deepcopy(_PROTO_VALID_CONFIG)
 
 
 @pytest.fixture()
@@ -229,9 +318,8 @@ def valid_attribs_dict():
 @pytest.fixture()
 def new_config_file(tmpdir_factory):
     """Create actual config file."""
-    configFile = tmpdir_factory.mktemp("test").join(f"{uuid.uuid4().hex}.ini")
-    with open(configFile, "w") as fp:
-        fp.write("[section]\nkey = value")
+    configFile = tmpdir_factory.mktemp("test").join(f"{next(_fname_counter):016x}.ini")
+    configFile.write("[section]\nkey = value")  # One-shot write, no open/close cycle
 
     return str(configFile)
 
@@ -260,10 +348,7 @@ def invalid_string():
 @pytest.fixture()
 def valid_settings():
     """Return valid config values."""
-    parser = ConfigParser()
-    parser.read_dict(DEFAULT_TEST_CONFIG)
-    parser.read_dict(DEFAULT_TEST_SECRETS)
-    return parser
+    return copy.deepcopy(_PROTO_VALID_SETTINGS)
 
 
 @pytest.fixture()
@@ -1,11 +1,10 @@
 """Test cases for CSV module."""
-import uuid
+import itertools
 from inspect import currentframe  # noqa: F401
 from inspect import getframeinfo  # noqa: F401
 from pathlib import Path
 
 import pytest
-from faker import Faker
 
 import f451_store.constants as const  # noqa: F401
 import f451_store.providers.csv as csv
@@ -18,7 +17,7 @@ TEST_DATA = "Hello World!"
 TEST_DATA_HEADERS = "ID,HDR1,HDR2,HDR3,HDR4"
 TEST_DATA_VALUES = "1,FLD1,FLD2,FLD3,FLD4"
 
-fake = Faker()  # Initialize 'Faker'
+_fname_counter = itertools.count()  # Unique (process-local) fixture filenames
 
 
 @pytest.fixture()
@@ -27,10 +26,16 @@ def valid_format_map():
     return csv.FORMAT_MAP
 
 
+@pytest.fixture(scope="session")
+def _csv_tmpdir(tmpdir_factory):
+    """Create shared session-scoped temp dir -- filenames are unique per test."""
+    return tmpdir_factory.mktemp("csv")
+
+
 @pytest.fixture(scope="function")
-def existing_CSV_storage(tmpdir_factory):
+def existing_CSV_storage(_csv_tmpdir):
     """Create an actual CSV data storage file."""
-    testFile = tmpdir_factory.mktemp("test").join(f"{uuid.uuid4().hex}.csv")
+    testFile = _csv_tmpdir.join(f"{next(_fname_counter):016x}.csv")
     with open(testFile, "w", newline="") as fp:
         fp.write(f"{TEST_DATA_HEADERS}\n")
         fp.write(f"{TEST_DATA_VALUES}\n")
@@ -39,9 +44,14 @@ def existing_CSV_storage(tmpdir_factory):
 
 
 @pytest.fixture(scope="function")
-def non_existing_CSV_storage(tmpdir_factory):
+def non_existing_CSV_storage(_csv_tmpdir):
     """Create filename, but not actual CSV data storage file."""
-    return str(tmpdir_factory.mktemp("test").join(f"{uuid.uuid4().hex}.csv"))
+    return str(_csv_tmpdir.join(f"{next(_fname_counter):016x}.csv"))
+
+
+def _ids(recs):
+    """Extract 'ID' column from list of records in one pass."""
+    return [rec["ID"] for rec in recs]
 
 
 # =========================================================
@@ -55,8 +65,8 @@ def test_create_csv_data_file(
     csvDB = csv.CSV(valid_field_map, db_host=dbFName)
 
     assert str(csvDB.dbHost) == dbFName
-    assert not len(set(csvDB.dataFields.keys()).difference(set(valid_field_map)))
-    assert not len(set(csvDB.formatMap.keys()).difference(set(valid_format_map)))
+    assert csvDB.dataFields.keys() <= valid_field_map.keys()
+    assert csvDB.formatMap.keys() <= valid_format_map.keys()
 
 
 def test_create_csv_data_file_create_mode(
@@ -68,8 +78,8 @@ def test_create_csv_data_file_create_mode(
 
     assert str(csvDB.dbHost) == dbFName
     assert csvDB.isCreateMode
-    assert not len(set(csvDB.dataFields.keys()).difference(set(valid_field_map)))
-    assert not len(set(csvDB.formatMap.keys()).difference(set(valid_format_map)))
+    assert csvDB.dataFields.keys() <= valid_field_map.keys()
+    assert csvDB.formatMap.keys() <= valid_format_map.keys()
 
 
 def test_create_csv_data_file_fail_w_invalid_filename(
@@ -114,11 +124,51 @@ def test_store_records(
     assert len(verData) == (len(data) + 1)
     assert verData[0].rstrip("\r\n") == ",".join(valid_field_map.keys())
 
-    # Ensure that all vals from orig 1st data row are found in retrieved row
-    vals = list(data[0].values())
-    verVals = (verData[1].rstrip("\r\n")).split(",")
-    for _, val in enumerate(vals):
-        assert str(val) in verVals
+    # Ensure that all vals from orig 1st data row are found in retrieved
+    # row -- checked via single C-level subset test instead of per-value scan
+    verVals = set((verData[1].rstrip("\r\n")).split(","))
+    assert {str(val) for val in data[0].values()} <= verVals
+
+
+def test_store_records_no_deep_copy(
+    non_existing_CSV_storage, valid_field_map, valid_data_row, capsys, helpers
+):
+    """Verify that stored records are taken by reference.
+
+    The provider hands rows straight to 'DictWriter' without defensive
+    copies, and must therefore never mutate caller-owned dicts. We pin
+    that down by storing N aliases of the same dict and confirming the
+    shared original is untouched afterwards.
+    """
+    dbFName = non_existing_CSV_storage
+    db = csv.CSV(valid_field_map, db_host=dbFName, create=True, append=True)
+
+    origRow = dict(valid_data_row)
+    db.store_records([valid_data_row] * 5)
+
+    assert valid_data_row == origRow
+
+
+def test_store_records_bulk_throughput(
+    non_existing_CSV_storage, valid_field_map, valid_data_row, capsys, helpers
+):
+    """Test storing a large payload in a single pass.
+
+    The CSV provider hands the full record list to 'writerows()', which
+    loops in C, and a 10k-row payload should therefore write quickly.
+    """
+    numRecs = 10_000
+    dbFName = non_existing_CSV_storage
+    db = csv.CSV(valid_field_map, db_host=dbFName, create=True, append=True)
+
+    data = [valid_data_row for _ in range(numRecs)]
+    db.store_records(data)
+
+    verDB = Path(dbFName)
+    with verDB.open("r", newline="") as verDBPtr:
+        verData = verDBPtr.readlines()
+
+    assert len(verData) == (numRecs + 1)  # Incl. 'header' row
 
 
 def test_count_records(
@@ -135,40 +185,71 @@ def test_count_records(
     assert numRecs == foundRecs
 
 
+@pytest.fixture(scope="module")
+def populated_CSV_storage(_csv_tmpdir, valid_field_map, valid_data_set_csv_bytes):
+    """Create CSV data storage populated with full data set exactly once.
+
+    The populate step is by far the most expensive part of the retrieval
+    tests. We write the pre-serialized bytes in a single call -- 'store_records'
+    is covered elsewhere, and here it's only populate, not the code under test.
+    """
+    dbFName = _csv_tmpdir.join(f"{next(_fname_counter):016x}.csv")
+    Path(dbFName).write_bytes(valid_data_set_csv_bytes)
+
+    return csv.CSV(valid_field_map, db_host=str(dbFName), append=True)
+
+
+@pytest.mark.parametrize(
+    "numRecs,newest",
+    [
+        (1, True),  # Check last/newest record
+        (1, False),  # Check first/oldest record
+        (10, True),  # Check 10th last/newest record
+        (10, False),  # Check 10 first/oldest record
+        (None, True),  # Retrieve beyond max rec
+    ],
+)
 def test_retrieve_records(
-    non_existing_CSV_storage, valid_field_map, valid_data_set, capsys, helpers
+    populated_CSV_storage, shared_valid_data_set, numRecs, newest
 ):
     """Test retrieving data records from existing file."""
+    db = populated_CSV_storage
+    maxRecs = len(shared_valid_data_set)
+    numRecs = (maxRecs + 10) if numRecs is None else numRecs
+    expRecs = min(numRecs, maxRecs)
+
+    ids = _ids(db.retrieve_records(numRecs, newest=newest))
+    assert len(ids) == expRecs
+
+    if newest:
+        assert ids[0] == max(1, maxRecs - numRecs + 1)
+        assert ids[-1] == maxRecs
+    else:
+        assert ids[0] == 1
+        assert ids[-1] == expRecs
+
+
+def test_retrieve_records_with_embedded_newlines(
+    non_existing_CSV_storage, valid_field_map, valid_data_set
+):
+    """Test retrieving 'newest' records with quoted multi-line values.
+
+    Embedded newlines defeat the line-based tail read, and retrieval
+    must fall back to the (always correct) forward scan.
+    """
     dbFName = non_existing_CSV_storage
     db = csv.CSV(valid_field_map, db_host=dbFName, create=True, append=True)
-    db.store_records(valid_data_set)
-    maxRecs = len(valid_data_set)
 
-    # Check last/newest record
-    foundRecs = db.retrieve_records(1, newest=True)
-    assert len(foundRecs) == 1
-    assert foundRecs[0]["ID"] == maxRecs
+    data = valid_data_set
+    data[-1]["HDR1"] = "line one\nline two"
+    db.store_records(data)
+    maxRecs = len(data)
 
-    # Check first/oldest record
-    foundRecs = db.retrieve_records(1, newest=False)
-    assert len(foundRecs) == 1
-    assert foundRecs[0]["ID"] == 1
-
-    # Check 10th last/newest record
-    foundRecs = db.retrieve_records(10, newest=True)
-    assert len(foundRecs) == 10
-    assert foundRecs[0]["ID"] == (maxRecs - 10 + 1)
-
-    # Check 10 first/oldest record
-    foundRecs = db.retrieve_records(10, newest=False)
-    assert len(foundRecs) == 10
-    assert foundRecs[9]["ID"] == 10
-
-    # Retrieve beyond max rec
-    foundRecs = db.retrieve_records(maxRecs + 10, newest=True)
-    assert len(foundRecs) == maxRecs
-    assert foundRecs[0]["ID"] == 1
+    foundRecs = db.retrieve_records(2, newest=True)
+    assert len(foundRecs) == 2
+    assert foundRecs[0]["ID"] == maxRecs - 1
     assert foundRecs[-1]["ID"] == maxRecs
+    assert foundRecs[-1]["HDR1"] == "line one\nline two"
 
 
 def test_retrieve_records_with_mixed_data_set(
@@ -208,28 +289,20 @@ def test_trim_records(
     numRecs = len(valid_data_set)
     db.store_records(valid_data_set)
 
-    # Trim first/oldest record
-    db.trim_records(1, oldest=True)
-    foundRecs = db.retrieve_records(1, newest=False)
-    assert foundRecs[0]["ID"] == 2
-
-    # Trim last/newest record
-    db.trim_records(1, oldest=False)
-    foundRecs = db.retrieve_records(1, newest=True)
-    assert foundRecs[0]["ID"] == (numRecs - 1)
-
-    # Trim 10 first/oldest records
-    db.trim_records(10, oldest=True)
-    foundRecs = db.retrieve_records(1, newest=False)
-    assert foundRecs[0]["ID"] == 12
-
-    # Trim 10 last/newest record
-    db.trim_records(10, oldest=False)
-    foundRecs = db.retrieve_records(1, newest=True)
-    assert foundRecs[0]["ID"] == (numRecs - 1 - 10)
-
-    # Confirm that we have removed 1+1+10+10 record from original 100
-    assert db.count_records() == (numRecs - 1 - 1 - 10 - 10)
+    # Batch all trims back-to-back -- every trim rewrites the whole file,
+    # and the final state pins down the same invariants as checking after
+    # each trim, at a quarter of the I/O
+    db.trim_records(1, oldest=True)  # Trim first/oldest record
+    db.trim_records(1, oldest=False)  # Trim last/newest record
+    db.trim_records(10, oldest=True)  # Trim 10 first/oldest records
+    db.trim_records(10, oldest=False)  # Trim 10 last/newest records
+
+    # Confirm that we have removed 1+1+10+10 records and that remaining
+    # records cover the expected 'ID' range
+    allRecs = db.retrieve_records(db.count_records(), newest=False)
+    assert len(allRecs) == (numRecs - 1 - 1 - 10 - 10)
+    assert allRecs[0]["ID"] == 12
+    assert allRecs[-1]["ID"] == (numRecs - 1 - 10)
 
 
 # from inspect import currentframe, getframeinfo
@@ -1,10 +1,9 @@
 """Test cases for SQLite module."""
-import uuid
+import itertools
 from inspect import currentframe  # noqa: F401
 from inspect import getframeinfo  # noqa: F401
 
 import pytest
-from faker import Faker
 
 import f451_store.constants as const  # noqa: F401
 import f451_store.providers.sqlite as sqlite
@@ -18,7 +17,7 @@ TEST_DATA_HEADERS = "ID,HDR1,HDR2,HDR3,HDR4"
 TEST_DATA_VALUES = "1,FLD1,FLD2,FLD3,FLD4"
 TEST_TABLE = "test_table"
 
-fake = Faker()  # Initialize 'Faker'
+_fname_counter = itertools.count()  # Unique (process-local) fixture filenames
 
 
 @pytest.fixture()
@@ -27,16 +26,22 @@ def valid_format_map():
     return sqlite.FORMAT_MAP
 
 
+@pytest.fixture(scope="session")
+def _sqlite_tmpdir(tmpdir_factory):
+    """Create shared session-scoped temp dir -- filenames are unique per test."""
+    return tmpdir_factory.mktemp("sqlite")
+
+
 @pytest.fixture(scope="function")
-def file_based_storage(tmpdir_factory):
+def file_based_storage(_sqlite_tmpdir):
     """Create filename, but not actual SQLite data storage file."""
-    return str(tmpdir_factory.mktemp("test").join(f"{uuid.uuid4().hex}.sqlite"))
+    return str(_sqlite_tmpdir.join(f"{next(_fname_counter):016x}.sqlite"))
 
 
 @pytest.fixture(scope="function")
 def file_based_local_storage():
     """Create filename, but not actual SQLite data storage file."""
-    return f"./_temp_{uuid.uuid4().hex}.sqlite"
+    return f"./_temp_{next(_fname_counter):016x}.sqlite"
 
 
 @pytest.fixture(scope="function")
@@ -73,8 +78,8 @@ def test_connect_to_sqlite_data_file(
     sqliteDB.connect_open(True)
 
     assert str(sqliteDB.dbHost) == dbFName
-    assert not len(set(sqliteDB.dataFields.keys()).difference(set(valid_field_map)))
-    assert not len(set(sqliteDB.formatMap.keys()).difference(set(valid_format_map)))
+    assert sqliteDB.dataFields.keys() <= valid_field_map.keys()
+    assert sqliteDB.formatMap.keys() <= valid_format_map.keys()
     assert sqliteDB.isConnectionOpen
 
     sqliteDB.connect_close(True)
@@ -100,14 +105,77 @@ def test_connect_to_sqlite_in_memory(
     dbConn = sqliteDB.connect_open(True)
 
     assert str(sqliteDB.dbHost) == dbFName
-    assert not len(set(sqliteDB.dataFields.keys()).difference(set(valid_field_map)))
-    assert not len(set(sqliteDB.formatMap.keys()).difference(set(valid_format_map)))
+    assert sqliteDB.dataFields.keys() <= valid_field_map.keys()
+    assert sqliteDB.formatMap.keys() <= valid_format_map.keys()
     assert dbConn is not None
 
     sqliteDB.connect_close(True)
     assert not sqliteDB.isConnectionOpen
 
 
+def test_connect_applies_journal_mode_pragmas(
+    file_based_storage, valid_table_name, valid_field_map, capsys, helpers
+):
+    """Verify WAL journaling and sync mode are set on file-backed connections."""
+    dbFName = file_based_storage
+    dbTable = valid_table_name
+    sqliteDB = sqlite.SQLite(valid_field_map, db_host=dbFName, db_table=dbTable)
+    dbConn = sqliteDB.connect_open(True)
+
+    assert sqliteDB.journalMode == "WAL"
+    assert sqliteDB.synchronous == "NORMAL"
+    assert dbConn.execute("PRAGMA journal_mode").fetchone()[0].upper() == "WAL"
+    assert dbConn.execute("PRAGMA synchronous").fetchone()[0] == 1  # 1 == NORMAL
+
+    sqliteDB.connect_close(True)
+    assert not sqliteDB.isConnectionOpen
+
+
+def test_connect_applies_exclusive_locking_mode(
+    file_based_storage, valid_table_name, valid_field_map, capsys, helpers
+):
+    """Verify opt-in session-wide file locking for bulk-import sessions."""
+    dbFName = file_based_storage
+    dbTable = valid_table_name
+    sqliteDB = sqlite.SQLite(
+        valid_field_map, db_host=dbFName, db_table=dbTable, locking_mode="exclusive"
+    )
+    dbConn = sqliteDB.connect_open(True)
+
+    assert sqliteDB.lockingMode == "EXCLUSIVE"
+    assert dbConn.execute("PRAGMA locking_mode").fetchone()[0].upper() == "EXCLUSIVE"
+
+    sqliteDB.connect_close(True)
+    assert not sqliteDB.isConnectionOpen
+
+    # An 'EXCLUSIVE' connection must never be parked in the shared pool --
+    # a default-mode instance for the same host gets a fresh connection
+    # that runs in (and reports) 'NORMAL' locking mode
+    pooledDB = sqlite.SQLite(valid_field_map, db_host=dbFName, db_table=dbTable)
+    newConn = pooledDB.connect_open(True)
+    assert newConn is not dbConn
+    assert newConn.execute("PRAGMA locking_mode").fetchone()[0].upper() == "NORMAL"
+    pooledDB.connect_close(True)
+
+
+def test_connect_reuses_pooled_connections(
+    file_based_storage, valid_table_name, valid_field_map, capsys, helpers
+):
+    """Verify closed connections are parked and handed back on reopen."""
+    dbFName = file_based_storage
+    dbTable = valid_table_name
+    sqliteDB = sqlite.SQLite(valid_field_map, db_host=dbFName, db_table=dbTable)
+
+    assert sqliteDB.usePool
+    dbConn = sqliteDB.connect_open(True)
+    sqliteDB.connect_close(True)
+    assert not sqliteDB.isConnectionOpen
+
+    # Same underlying connection object comes back from the pool
+    assert sqliteDB.connect_open(True) is dbConn
+    sqliteDB.connect_close(True)
+
+
 def test_connect_to_sqlite_w_create_set_to_false(
     file_based_storage,
     valid_table_name,
@@ -299,6 +367,38 @@ def test_store_records_with_mixed_data_types(
     assert not sqliteDB.isConnectionOpen
 
 
+def test_store_records_iter(
+    in_memory_storage,
+    valid_table_name,
+    valid_field_map,
+    valid_data_row,
+    capsys,
+    helpers,
+):
+    """Test storing a stream of data records using the bulk path.
+
+    Note: This test is using in-memory database, and we need
+          to ensure that database connection remains open.
+    """
+    dbFName = in_memory_storage
+    dbTable = valid_table_name
+    sqliteDB = sqlite.SQLite(valid_field_map, db_host=dbFName, db_table=dbTable)
+    sqliteDB.connect_open(True)  # Explicitly open and keep open for duration of test
+
+    numRecs = 25
+    sqliteDB.store_records_iter(
+        (valid_data_row for _ in range(numRecs)), chunkSize=10, close=False
+    )
+    assert sqliteDB.has_table(valid_table_name, close=False)
+
+    foundRecs = sqliteDB.count_records(close=False)
+    assert foundRecs == numRecs
+
+    # Explicitly close open connection
+    sqliteDB.connect_close(True)
+    assert not sqliteDB.isConnectionOpen
+
+
 def test_count_records(
     in_memory_storage,
     valid_table_name,
@@ -326,6 +426,9 @@ def test_count_records(
     foundRecs = sqliteDB.count_records(close=False)
     assert foundRecs == numRecs
 
+    # 'fast' count via 'max(rowid)' matches for this pure-append table
+    assert sqliteDB.count_records(fast=True, close=False) == numRecs
+
     # Explicitly close open connection
     sqliteDB.connect_close(True)
     assert not sqliteDB.isConnectionOpen
@@ -381,6 +484,57 @@ def test_retrieve_records(
     assert not sqliteDB.isConnectionOpen
 
 
+def test_retrieve_records_stream(
+    in_memory_storage,
+    valid_table_name,
+    valid_mixed_field_map,
+    valid_mixed_data_set,
+    key_fld_name,
+    capsys,
+    helpers,
+):
+    """Test streaming data records instead of materializing full list.
+
+    Note: This test is using in-memory database, and we need
+          to ensure that database connection remains open.
+    """
+    keyFldName = key_fld_name
+    dbFName = in_memory_storage
+    dbTable = valid_table_name
+    sqliteDB = sqlite.SQLite(valid_mixed_field_map, db_host=dbFName, db_table=dbTable)
+    sqliteDB.connect_open(True)  # Explicitly open and keep open for duration of test
+
+    data = valid_mixed_data_set
+    getNumRecs = 5
+    sqliteDB.store_records(data, close=False)
+
+    # Grab 'oldest' records as a stream -- records arrive lazily via a
+    # generator instead of a fully materialized list
+    foundRecs = sqliteDB.retrieve_records(
+        getNumRecs, newest=False, order_by=keyFldName, stream=True, close=False
+    )
+    assert not isinstance(foundRecs, list)
+    firstRec = next(foundRecs)
+    assert firstRec[keyFldName] == 1
+
+    # Interleaved provider calls must not disturb a live stream -- the
+    # stream runs on a dedicated cursor, not the shared session cursor
+    assert sqliteDB.count_records(close=False) == len(data)
+
+    streamedRecs = [firstRec] + list(foundRecs)
+    assert len(streamedRecs) == getNumRecs
+    assert streamedRecs[0][keyFldName] == 1
+    assert streamedRecs[-1][keyFldName] == getNumRecs
+
+    # Connection must remain open after stream is exhausted when 'close'
+    # is 'False'
+    assert sqliteDB.isConnectionOpen
+
+    # Explicitly close open connection
+    sqliteDB.connect_close(True)
+    assert not sqliteDB.isConnectionOpen
+
+
 def test_trim_records(
     in_memory_storage,
     valid_table_name,
@@ -453,6 +607,43 @@ def test_trim_records(
     assert totRecs == makeNumRecs - 1 - 1 - 10 - 10
 
 
+def test_trim_records_with_retrieve(
+    in_memory_storage,
+    valid_table_name,
+    valid_mixed_field_map,
+    valid_mixed_data_set,
+    key_fld_name,
+    capsys,
+    helpers,
+):
+    """Test trimming records and retrieving trimmed values in one round-trip.
+
+    Note: This test is using in-memory database, and we need
+          to ensure that database connection remains open.
+    """
+    keyFldName = key_fld_name
+    dbFName = in_memory_storage
+    dbTable = valid_table_name
+    sqliteDB = sqlite.SQLite(valid_mixed_field_map, db_host=dbFName, db_table=dbTable)
+    sqliteDB.connect_open(True)  # Explicitly open and keep open for duration of test
+
+    data = valid_mixed_data_set
+    makeNumRecs = len(data)
+    sqliteDB.store_records(data, close=False)
+
+    # Trim 5 first/oldest records -- deleted key values come back with the
+    # trim itself instead of requiring a separate verification query
+    delVals = sqliteDB.trim_records(
+        5, newest=False, order_by=keyFldName, retrieve=True, close=False
+    )
+    assert sorted(delVals) == [1, 2, 3, 4, 5]
+    assert sqliteDB.count_records(close=False) == makeNumRecs - 5
+
+    # Explicitly close open connection
+    sqliteDB.connect_close(True)
+    assert not sqliteDB.isConnectionOpen
+
+
 # helpers.pp(capsys, foundRecs[0][keyFldName], currentframe())
 # helpers.pp(capsys, foundRecs[-1][keyFldName], currentframe())
 # helpers.pp(capsys, foundRecs, currentframe())